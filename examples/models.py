@@ -0,0 +1,14 @@
+from sqlalchemy import BIGINT, Column, VARCHAR, func, TEXT, TIMESTAMP, cast
+from sqlalchemy.dialects.postgresql import BYTEA
+from sqlalchemy.ext.declarative import declarative_base
+
+Base = declarative_base()
+
+GENERATE_SHA_1_HASH = func.digest(cast(cast(func.random(), TEXT), BYTEA), 'sha1')
+
+
+class Message(Base):
+    __tablename__ = 'messages'
+    id = Column(BIGINT, primary_key=True)
+    message_hash = Column(VARCHAR(64), server_default=GENERATE_SHA_1_HASH)
+    created_at = Column(TIMESTAMP(timezone=True), server_default=func.now())
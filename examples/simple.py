@@ -1,7 +1,7 @@
 from sqlalchemy import select, create_engine
 from sqlalchemy.orm import sessionmaker
 
-from examples.rest_api import Message
+from examples.models import Message
 from sqlapagination import KeySetPaginator
 
 engine = create_engine(
@@ -6,6 +6,8 @@ from .constants import DEFAULT_PAGE_SIZE
 __all__ = (
     'KeySetPaginator',
     'KeySetPage',
+    'encode_cursor',
+    'decode_cursor',
     'LimitOffsetPaginator',
     'LimitOffsetPage',
     'JoinBasedPaginator',
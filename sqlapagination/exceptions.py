@@ -1,2 +1,6 @@
 class KeySetPairsMismatchQueryError(Exception):
     pass
+
+
+class InvalidCursorError(Exception):
+    pass
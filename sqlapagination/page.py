@@ -6,6 +6,7 @@ _T_co = TypeVar('_T_co', covariant=True)
 
 
 class AbstractPage(Sequence[T], Generic[T], abc.ABC):
+    __slots__ = ('_rows',)
 
     def __init__(self, rows: List[T]) -> None:
         self._rows = rows
@@ -15,6 +15,7 @@ P = TypeVar('P')
 
 
 class Paginator(abc.ABC, Generic[R]):
+    __slots__ = ('_page_size', '_select_or_query', '_bookmark', '_is_backward')
 
     def __init__(
             self,
@@ -28,6 +29,7 @@ class Paginator(abc.ABC, Generic[R]):
         if bookmark is None:
             bookmark = {}
         self._bookmark = bookmark
+        self._is_backward = bookmark.get("direction") == "backward"
 
     @abc.abstractmethod
     def get_modified_sql_statement(self) -> SelectOrQuery:
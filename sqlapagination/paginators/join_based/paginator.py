@@ -1,6 +1,7 @@
-from typing import Optional, Dict, Any, List
+from typing import Optional, Dict, Any, Tuple
 
-from sqlalchemy import select, Table, and_, Column
+from sqlalchemy import select, and_, func, Column
+from sqlalchemy.sql.expression import Label, FromClause
 
 from sqlapagination.paginators.limit_offset.paginator import LimitOffsetPaginator
 from sqlapagination.constants import DEFAULT_PAGE_SIZE
@@ -8,6 +9,7 @@ from sqlapagination.paginators.base import SelectOrQuery
 
 
 class JoinBasedPaginator(LimitOffsetPaginator):
+    __slots__ = ()
 
     def __init__(
             self,
@@ -18,18 +20,33 @@ class JoinBasedPaginator(LimitOffsetPaginator):
         super().__init__(query_or_select, page_size, bookmark)
         self._offset = self._bookmark.get("offset", 0)
 
-    def get_modified_sql_statement(self) -> SelectOrQuery:
-        first_from: Table = self._select_or_query.get_final_froms()[0]
-        primary_key_constraint = first_from.primary_key
+    def _resolve_seek_keys(self) -> Tuple[Column, ...]:
+        # Pages are always located by offset in the primary key subselect, so no
+        # `last_seen_pk` bookmark is emitted
+        return ()
+
+    def _get_first_from(self) -> FromClause:
+        first_from = super()._get_first_from()
+        if first_from is None:
+            raise ValueError("JoinBasedPaginator requires a statement selecting from a table")
+        return first_from
 
-        primary_keys: List[Column] = [column for column in primary_key_constraint.columns]
-        subselect = select(*primary_keys).select_from(first_from).order_by(
+    def get_modified_sql_statement(self) -> SelectOrQuery:
+        primary_keys = self._get_primary_keys()
+        subselect = select(*primary_keys).select_from(self._get_first_from()).order_by(
             *primary_keys
         ).limit(self._page_size).offset(self._offset).subquery()
 
-        join_clause = [c == s for c, s in zip(primary_key_constraint.columns, subselect.columns)]
+        join_clause = [c == s for c, s in zip(primary_keys, subselect.columns)]
 
-        return self._with_total_count_subquery(self._select_or_query).join(
+        return self._with_total_count(self._select_or_query).join(
             subselect,
             onclause=and_(*join_clause)
         )
+
+    def _build_total_count_column(self) -> Label:
+        # The statement is joined with a single page of primary keys, which leaves a window
+        # count over the page only, so the count is taken from a scalar subquery instead
+        return select(
+            func.count("*")
+        ).select_from(self._get_first_from()).scalar_subquery().label(self._total_count_key)
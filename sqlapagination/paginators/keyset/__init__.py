@@ -1,4 +1,5 @@
+from .cursor import encode_cursor, decode_cursor
 from .page import KeySetPage
 from .paginator import KeySetPaginator
 
-__all__ = ('KeySetPage', 'KeySetPaginator')
+__all__ = ('KeySetPage', 'KeySetPaginator', 'encode_cursor', 'decode_cursor')
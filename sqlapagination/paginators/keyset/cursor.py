@@ -0,0 +1,38 @@
+"""
+Opaque cursor tokens for keyset bookmarks.
+"""
+import base64
+import binascii
+import json
+from typing import Any, Dict, Optional
+
+from sqlapagination.exceptions import InvalidCursorError
+
+
+def encode_cursor(bookmark: Dict[str, Any]) -> str:
+    """Encode a keyset bookmark into a compact url-safe token.
+
+    Keyset values of the bookmark must be JSON serializable."""
+    payload = json.dumps(bookmark, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(payload).rstrip(b"=").decode("ascii")
+
+
+def decode_cursor(cursor: str) -> Dict[str, Any]:
+    """Decode a token produced by :func:`encode_cursor` back into a bookmark."""
+    padding = "=" * (-len(cursor) % 4)
+    try:
+        bookmark = json.loads(base64.urlsafe_b64decode(cursor + padding))
+    except (binascii.Error, ValueError) as exc:
+        raise InvalidCursorError(f"Cursor {cursor!r} is malformed") from exc
+
+    if not isinstance(bookmark, dict):
+        raise InvalidCursorError(f"Cursor {cursor!r} does not contain a bookmark")
+
+    return bookmark
+
+
+def decode_cursor_if_required(bookmark: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    if bookmark is None or "cursor" not in bookmark or "keyset_pairs" in bookmark:
+        return bookmark
+
+    return decode_cursor(bookmark["cursor"])
@@ -1,15 +1,45 @@
-from _warnings import warn
-from typing import Any
+import os
+import weakref
+from typing import Any, Set
 
+# Opt-out of the nullable ordering column check, for deployments that filter its warnings anyway
+_NULLABILITY_CHECK_DISABLED = os.getenv("SQLAPAGINATION_SKIP_NULL_WARN") == "1"
+
+# Ids of columns that have already been inspected and do not need a warning.
+# Columns are looked up by id, since comparing SQLAlchemy columns with == builds SQL
+# expressions; an id is forgotten once its column is garbage collected. Nullable columns
+# are not remembered, so the warning is still issued every time.
+_NOT_NULLABLE_COLUMN_IDS: Set[int] = set()
+
+
+def warn_if_column_nullable(column: Any, stacklevel: int = 1) -> None:
+    """Warn that ordering by `column` may omit rows if it is nullable. `stacklevel` is
+    counted from the caller, as in :func:`warnings.warn`."""
+    if _NULLABILITY_CHECK_DISABLED:
+        return
+
+    if id(column) in _NOT_NULLABLE_COLUMN_IDS:
+        return
 
-def warn_if_column_nullable(column: Any) -> None:
     try:
-        if column.nullable or column.property.columns[0].nullable:
-            warn(
-                "Ordering by nullable column {} can cause rows to be "
-                "incorrectly omitted from the results. "
-                "See the sqlapagination README.md for more details.".format(column),
-                stacklevel=7,
-            )
+        is_nullable = column.nullable or column.property.columns[0].nullable
     except (AttributeError, IndexError, KeyError):
-        pass
+        is_nullable = False
+
+    if is_nullable:
+        import warnings
+
+        warnings.warn(
+            "Ordering by nullable column {} can cause rows to be "
+            "incorrectly omitted from the results. "
+            "See the sqlapagination README.md for more details.".format(column),
+            stacklevel=stacklevel + 1,
+        )
+        return
+
+    try:
+        weakref.finalize(column, _NOT_NULLABLE_COLUMN_IDS.discard, id(column))
+    except TypeError:
+        # Without a weak reference the id could outlive the column and be reused
+        return
+    _NOT_NULLABLE_COLUMN_IDS.add(id(column))
@@ -1,42 +1,64 @@
-from collections import OrderedDict
-from typing import Any, Dict, TYPE_CHECKING, List
+from typing import Any, Dict, TYPE_CHECKING, List, Optional
 
 from sqlapagination.page import AbstractPage, T
-from ...utils import get_value_from_row_by_column_name
+from .cursor import encode_cursor
+from ...utils import get_values_from_row_by_column_names
 
 if TYPE_CHECKING:
     from .paginator import ParsingMetadata
 
 
 class KeySetPage(AbstractPage):
+    __slots__ = (
+        '_metadata',
+        '_previous_bookmark',
+        '_order_by_column_names',
+        '_first_keyset_pair',
+        '_last_keyset_pair',
+        '_next_keyset_pair',
+        '_previous_keyset_pair',
+    )
 
     def __init__(self, rows: List[T], parsing_metadata: "ParsingMetadata") -> None:
         super().__init__(rows)
         self._metadata = parsing_metadata
-        self._rows = self._rows[:self._metadata.page_size]
-
-        self._keyset_pairs_table = OrderedDict()
-        for idx, row in enumerate(rows):
-            self._keyset_pairs_table[idx] = {
-                column.name: get_value_from_row_by_column_name(row, column.name)
-                for column in self._metadata.order_by_columns
-            }
-
         self._previous_bookmark = parsing_metadata.bookmark
-        if self._previous_bookmark.get("direction", "forward") == "backward":
-            self._keyset_pairs_table = OrderedDict(
-                reversed(list(self._keyset_pairs_table.items()))
-            )
-            self._rows = list(reversed(self._rows))
-
-        self._first_keyset_pair = self._keyset_pairs_table.get(0)
-        self._last_keyset_pair = self._keyset_pairs_table.get(len(self._rows) - 1)
 
-        # Additional keyset pair determines whether there are more entries in database
-        self._additional_keyset_pair = self._keyset_pairs_table.get(len(self._rows))
-
-        self._next_keyset_pair = self._additional_keyset_pair or self._last_keyset_pair
-        self._previous_keyset_pair = self._previous_bookmark.get("keyset_pairs")
+        page_size = self._metadata.page_size
+        is_backward = self._metadata.is_backward
+        if is_backward:
+            # Backward pages are fetched in reversed order, so slice and reverse them at once
+            self._rows = rows[page_size - 1::-1] if page_size > 0 else []
+        else:
+            self._rows = rows[:page_size]
+
+        self._order_by_column_names = tuple(c.name for c in self._metadata.order_by_columns)
+
+        # Only the boundary rows are needed to build bookmarks, so there is no point
+        # in extracting keyset pairs from every fetched row. For backward pages the first
+        # displayed row is the last fetched one and vice versa.
+        first_index, last_index = 0, len(self._rows) - 1
+        if is_backward:
+            first_index, last_index = last_index, first_index
+        self._first_keyset_pair = self._get_keyset_pair(rows, first_index)
+        self._last_keyset_pair = self._get_keyset_pair(rows, last_index)
+
+        # An additional row is fetched to tell whether there are more entries in the
+        # fetching direction, the bookmark tells that there are entries in the other one
+        has_more_entries = len(rows) > len(self._rows)
+        has_bookmark = self._previous_bookmark.get("keyset_pairs") is not None
+        if is_backward:
+            self._next_keyset_pair = self._last_keyset_pair
+            self._previous_keyset_pair = self._first_keyset_pair if has_more_entries else None
+        else:
+            self._next_keyset_pair = self._last_keyset_pair if has_more_entries else None
+            self._previous_keyset_pair = self._first_keyset_pair if has_bookmark else None
+
+    def _get_keyset_pair(self, rows: List[T], index: int) -> Optional[Dict[str, Any]]:
+        if not 0 <= index < len(rows):
+            return None
+
+        return get_values_from_row_by_column_names(rows[index], self._order_by_column_names)
 
     @property
     def total_pages_count(self) -> int:
@@ -72,6 +94,14 @@ class KeySetPage(AbstractPage):
             "direction": "forward"
         }
 
+    @property
+    def next_cursor(self) -> Optional[str]:
+        """The :attr:`next` bookmark encoded as an opaque url-safe token."""
+        if not self.has_next:
+            return None
+
+        return encode_cursor(self.next)
+
     @property
     def has_next(self) -> bool:
         return self._next_keyset_pair is not None
@@ -86,6 +116,14 @@ class KeySetPage(AbstractPage):
             "direction": "backward"
         }
 
+    @property
+    def previous_cursor(self) -> Optional[str]:
+        """The :attr:`previous` bookmark encoded as an opaque url-safe token."""
+        if not self.has_previous:
+            return None
+
+        return encode_cursor(self.previous)
+
     @property
     def has_previous(self) -> bool:
         return self._previous_keyset_pair is not None
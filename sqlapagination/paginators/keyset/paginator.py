@@ -1,15 +1,18 @@
 import contextlib
-from dataclasses import dataclass, field
-from typing import Optional, Generic, Sequence, List, Any, Dict
+import weakref
+from dataclasses import dataclass
+from typing import Optional, Generic, Sequence, List, Any, Dict, Callable, Tuple
 
 from sqlalchemy import tuple_, Column
 from sqlalchemy.engine import Row
-from sqlalchemy.sql.elements import BooleanClauseList, or_, and_, UnaryExpression
+from sqlalchemy.sql.elements import BooleanClauseList, or_, and_, UnaryExpression, ColumnElement
 
 from sqlapagination.constants import DEFAULT_PAGE_SIZE
 from sqlapagination.exceptions import KeySetPairsMismatchQueryError
 from sqlapagination.page import AbstractPage, T
 from sqlapagination.paginators.base import Paginator, SelectOrQuery
+from sqlapagination.paginators.keyset.cursor import decode_cursor_if_required
+from sqlapagination.paginators.keyset.inspection.columns import warn_if_column_nullable
 from sqlapagination.paginators.keyset.page import KeySetPage
 from sqlapagination.paginators.keyset.utils.ordering import parse_order_by_clause, find_order_key, \
     OrderByColumnWrapper
@@ -19,17 +22,99 @@ from sqlapagination.utils import get_column_descriptors, get_group_by_clauses, \
 SUPPORTS_NATIVE_ROW_VALUES_COMPARISON = {"postgresql", "mysql", "sqlite"}
 
 
+FilterBuilder = Callable[[Sequence[Any], Sequence[Any]], ColumnElement]
+
+
+def _compare_single_values(lesser: Sequence[Any], greater: Sequence[Any]) -> ColumnElement:
+    return lesser[0] < greater[0]
+
+
+def _compare_row_values(lesser: Sequence[Any], greater: Sequence[Any]) -> ColumnElement:
+    return tuple_(*lesser) < tuple_(*greater)
+
+
+def _compare_row_values_lexicographically(lesser: Sequence[Any], greater: Sequence[Any]) -> ColumnElement:
+    # Expand (a, b, c) < (x, y, z) into a < x OR (a = x AND (b < y OR (b = y AND c < z))),
+    # which grows linearly with the number of columns
+    filter_condition = lesser[-1] < greater[-1]
+    for index in range(len(lesser) - 2, -1, -1):
+        filter_condition = or_(
+            lesser[index] < greater[index],
+            and_(lesser[index] == greater[index], filter_condition)
+        )
+
+    return filter_condition
+
+
+class _OrderingAnalysis:
+    """ORDER BY analysis of a selectable, it depends only on the selectable itself,
+    so it's shared by all paginators over the same selectable."""
+
+    def __init__(self, selectable: SelectOrQuery) -> None:
+        self.order_by_columns = parse_order_by_clause(selectable)
+        self.column_descriptors = tuple(get_column_descriptors(selectable))
+        self._scaffolded: Dict[
+            bool, Tuple[Tuple[OrderByColumnWrapper, ...], Tuple[UnaryExpression, ...]]
+        ] = {}
+
+    def scaffold(
+            self,
+            is_backward: bool
+    ) -> Tuple[Tuple[OrderByColumnWrapper, ...], Tuple[UnaryExpression, ...]]:
+        try:
+            return self._scaffolded[is_backward]
+        except KeyError:
+            pass
+
+        order_by_columns = self.order_by_columns
+        if is_backward:
+            order_by_columns = tuple([c.reversed for c in order_by_columns])
+
+        mapped_order_by_columns = [find_order_key(c, self.column_descriptors) for c in order_by_columns]
+        scaffolded = order_by_columns, tuple([column.order_by_clause for column in mapped_order_by_columns])
+        self._scaffolded[is_backward] = scaffolded
+        return scaffolded
+
+
+_ORDERING_ANALYSIS_CACHE: "weakref.WeakKeyDictionary[Any, _OrderingAnalysis]" = weakref.WeakKeyDictionary()
+
+
+def _analyze_ordering(selectable: SelectOrQuery) -> _OrderingAnalysis:
+    try:
+        return _ORDERING_ANALYSIS_CACHE[selectable]
+    except KeyError:
+        pass
+    except TypeError:
+        return _OrderingAnalysis(selectable)
+
+    analysis = _OrderingAnalysis(selectable)
+    _ORDERING_ANALYSIS_CACHE[selectable] = analysis
+    return analysis
+
+
 @dataclass
 class ParsingMetadata:
-    page_size: int = DEFAULT_PAGE_SIZE
-    order_by_columns: List[OrderByColumnWrapper] = field(default_factory=list)
-    bookmark: Dict[str, Any] = field(default_factory=dict)
+    __slots__ = ('page_size', 'order_by_columns', 'bookmark', 'is_backward')
+
+    page_size: int
+    order_by_columns: Tuple[OrderByColumnWrapper, ...]
+    bookmark: Dict[str, Any]
+    is_backward: bool
 
-    def __post_init__(self) -> None:
-        self.expected_entries_count = self.page_size + 1
+    @property
+    def expected_entries_count(self) -> int:
+        return self.page_size + 1
 
 
 class KeySetPaginator(Paginator[T], Generic[T]):
+    __slots__ = (
+        '_ordering',
+        '_order_by_columns',
+        '_order_by_column_names',
+        '_order_by_clauses',
+        '_dialect',
+        '_build_filter',
+    )
 
     # TODO before keyset and after keyset values
     def __init__(
@@ -39,36 +124,34 @@ class KeySetPaginator(Paginator[T], Generic[T]):
             dialect: Optional[Any] = None,
             bookmark: Optional[Dict[str, Any]] = None
     ) -> None:
-        super().__init__(query_or_select, page_size, bookmark)
-        self._order_by_columns = parse_order_by_clause(self._select_or_query)
-        self._order_by_clauses: List[UnaryExpression] = self._scaffold_order_by_clauses()
+        super().__init__(query_or_select, page_size, decode_cursor_if_required(bookmark))
+        self._ordering = _analyze_ordering(self._select_or_query)
+        self._order_by_columns = self._ordering.order_by_columns
+        # Checked per paginator rather than when parsing, since the ordering analysis is
+        # shared, and attributed to the code constructing the paginator
+        for order_by_column in self._order_by_columns:
+            warn_if_column_nullable(order_by_column.comparable_value, stacklevel=2)
+        self._order_by_column_names = tuple(c.name for c in self._order_by_columns)
+        self._order_by_clauses: Tuple[UnaryExpression, ...] = self._scaffold_order_by_clauses()
         self._dialect = dialect
+        self._build_filter = self._select_filter_builder()
 
     @contextlib.contextmanager
     def bookmarked(self, bookmark: Dict[str, Any]):
-        self._bookmark = bookmark
+        self._bookmark = decode_cursor_if_required(bookmark)
+        self._is_backward = self._bookmark.get("direction") == "backward"
 
         try:
             self._order_by_clauses = self._scaffold_order_by_clauses()
             yield self
         finally:
             self._bookmark = {}
+            self._is_backward = False
             self._order_by_clauses = self._scaffold_order_by_clauses()
 
-    def _scaffold_order_by_clauses(self) -> List[UnaryExpression]:
-        if self._should_reverse_order_by_clause():
-            self._order_by_columns = [c.reversed for c in self._order_by_columns]
-
-        column_descriptors = get_column_descriptors(self._select_or_query)
-        mapped_order_by_columns = [find_order_key(c, column_descriptors) for c in self._order_by_columns]
-
-        return [column.order_by_clause for column in mapped_order_by_columns]
-
-    def _should_reverse_order_by_clause(self) -> bool:
-        if self._bookmark.get("direction", "forward") == "backward":
-            return True
-
-        return False
+    def _scaffold_order_by_clauses(self) -> Tuple[UnaryExpression, ...]:
+        self._order_by_columns, order_by_clauses = self._ordering.scaffold(self._is_backward)
+        return order_by_clauses
 
     def get_modified_sql_statement(self) -> SelectOrQuery:
         select_or_query = self._apply_filter_condition_if_required().order_by(
@@ -83,14 +166,12 @@ class KeySetPaginator(Paginator[T], Generic[T]):
         if not self._bookmark:
             return self._select_or_query
 
-        group_by_clauses = get_group_by_clauses(self._select_or_query)
         keyset_pairs: Dict[str, Any] = self._bookmark["keyset_pairs"]
 
-        order_by_column_names = [c.name for c in self._order_by_columns]
-        if order_by_column_names != list(keyset_pairs.keys()):
+        if self._order_by_column_names != tuple(keyset_pairs):
             raise KeySetPairsMismatchQueryError(
                 "Order by columns are not equal to keyset pairs\n"
-                f"{list(keyset_pairs.keys())} != {order_by_column_names}"
+                f"{list(keyset_pairs)} != {list(self._order_by_column_names)}"
             )
 
         zipped = zip(self._order_by_columns, keyset_pairs.values())
@@ -102,6 +183,7 @@ class KeySetPaginator(Paginator[T], Generic[T]):
 
         filter_condition = self._compare_sql_row_values(greater=greater_row, lesser=lesser_row)
 
+        group_by_clauses = get_group_by_clauses(self._select_or_query)
         if group_by_clauses is not None and len(group_by_clauses) > 0:
             return self._select_or_query.having(filter_condition)
 
@@ -111,21 +193,18 @@ class KeySetPaginator(Paginator[T], Generic[T]):
         if len(lesser) != len(greater):
             raise ValueError("Tuples must have same length to be compared!")
 
-        if len(lesser) == 1:
-            return lesser[0] < greater[0]
+        return self._build_filter(lesser, greater)
 
-        if self._dialect is not None and self._dialect.name.lower() in SUPPORTS_NATIVE_ROW_VALUES_COMPARISON:
-            return tuple_(*lesser) < tuple_(*greater)
+    def _select_filter_builder(self) -> FilterBuilder:
+        # Both the number of order by columns and the dialect are fixed for the paginator's
+        # lifetime, so the way keysets are compared can be decided once
+        if len(self._order_by_columns) == 1:
+            return _compare_single_values
 
-        return or_(
-            *[
-                and_(
-                    *[lesser[index] == greater[index] for index in range(eq_depth)],
-                    lesser[eq_depth] < greater[eq_depth]
-                )
-                for eq_depth in range(len(lesser))
-            ]
-        )
+        if self._dialect is None or self._dialect.name.lower() in SUPPORTS_NATIVE_ROW_VALUES_COMPARISON:
+            return _compare_row_values
+
+        return _compare_row_values_lexicographically
 
     def parse_result(
             self,
@@ -136,6 +215,7 @@ class KeySetPaginator(Paginator[T], Generic[T]):
             parsing_metadata=ParsingMetadata(
                 page_size=self._page_size,
                 order_by_columns=self._order_by_columns,
-                bookmark=self._bookmark
+                bookmark=self._bookmark,
+                is_backward=self._is_backward
             )
         )
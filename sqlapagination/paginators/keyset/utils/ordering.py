@@ -3,8 +3,10 @@ Internal API for ordering. Copied directly from sqlakeyset source code.
 """
 
 import abc
-from copy import copy
-from typing import Any, List, Callable, Optional, Tuple, Union, Sequence
+import itertools
+from collections import deque
+from operator import itemgetter, attrgetter
+from typing import Any, List, Callable, Optional, Tuple, Union, Sequence, Dict
 from warnings import warn
 
 import sqlalchemy
@@ -19,12 +21,13 @@ from sqlalchemy.sql.expression import ClauseList, ColumnElement, Label
 from sqlalchemy.sql.operators import asc_op, desc_op, nullsfirst_op, nullslast_op
 
 from sqlapagination.constants import ORDER_COL_PREFIX
-from sqlapagination.paginators.keyset.inspection.columns import warn_if_column_nullable
 from sqlapagination.utils import get_order_by_clauses
 
 _LABELLED = (Label, _label_reference)
-_ORDER_MODIFIERS = (asc_op, desc_op, nullsfirst_op, nullslast_op)
-_UNSUPPORTED_ORDER_MODIFIERS = (nullsfirst_op, nullslast_op)
+_NESTED_CLAUSES = (ClauseList, tuple, list)
+_ASC_DESC = frozenset({asc_op, desc_op})
+_ORDER_MODIFIERS = frozenset({asc_op, desc_op, nullsfirst_op, nullslast_op})
+_UNSUPPORTED_ORDER_MODIFIERS = frozenset({nullsfirst_op, nullslast_op})
 _WRAPPING_DEPTH = 1000
 _WRAPPING_OVERFLOW = (
     "Maximum element wrapping depth reached; there's "
@@ -33,29 +36,37 @@ _WRAPPING_OVERFLOW = (
 )
 
 
-def parse_order_by_clause(selectable: Union[Select, Query]) -> List["OrderByColumnWrapper"]:
-    """Parse the ORDER BY clause of a selectable into a list of :class:`OC` instances."""
-    return [
-        OrderByColumnWrapper(clause)
-        for clause in _flatten_order_by_clauses(get_order_by_clauses(selectable))
-    ]
+def parse_order_by_clause(selectable: Union[Select, Query]) -> Tuple["OrderByColumnWrapper", ...]:
+    """Parse the ORDER BY clause of a selectable into a tuple of :class:`OC` instances."""
+    return _parse_order_by_clauses(get_order_by_clauses(selectable))
 
 
-def _flatten_order_by_clauses(order_by_clauses: Sequence[Union[ClauseList, Column]]) -> List[Any]:
+def _parse_order_by_clauses(order_by_clauses: Sequence[Any]) -> Tuple["OrderByColumnWrapper", ...]:
+    # ORDER BY clauses are usually flat already, which needs no flattening at all
+    if not any(isinstance(clause, _NESTED_CLAUSES) for clause in order_by_clauses):
+        return tuple([OrderByColumnWrapper(clause) for clause in order_by_clauses])
+
+    flattened: List[Any] = []
+    _flatten_order_by_clauses_into(order_by_clauses, flattened)
+    return tuple([OrderByColumnWrapper(clause) for clause in flattened])
+
+
+def _flatten_order_by_clauses_into(order_by_clauses: Sequence[Union[ClauseList, Column]], out: List[Any]) -> None:
     """
     Flatten a list of :class:`sqlalchemy.sql.expression.ClauseList` instances
-    into a list of :class:`sqlalchemy.sql.expression.ColumnElement` instances.
+    into `out`, a list of :class:`sqlalchemy.sql.expression.ColumnElement` instances.
     """
-    if isinstance(order_by_clauses, ClauseList):
-        for subclause in order_by_clauses.clauses:
-            for x in _flatten_order_by_clauses(subclause):
-                yield x
-    elif isinstance(order_by_clauses, (tuple, list)):
-        for xs in order_by_clauses:
-            for x in _flatten_order_by_clauses(xs):
-                yield x
-    else:
-        yield order_by_clauses
+    # Nested clauses are traversed with an explicit stack rather than recursion,
+    # children are pushed in reverse so they're popped in their original order
+    stack = deque([order_by_clauses])
+    while stack:
+        clause = stack.pop()
+        if isinstance(clause, ClauseList):
+            stack.extend(reversed(clause.clauses))
+        elif isinstance(clause, (tuple, list)):
+            stack.extend(reversed(clause))
+        else:
+            out.append(clause)
 
 
 class OrderByColumnWrapper:
@@ -63,26 +74,36 @@ class OrderByColumnWrapper:
     :class:`sqlalchemy.sql.expression.ColumnElement` appearing in the ORDER BY
     clause of a query we are paging."""
 
+    __slots__ = (
+        "column_name_or_obj",
+        "full_name",
+        "table_name",
+        "name",
+        "_direction",
+        "_element",
+        "_comparable_value",
+        "_processor_cache"
+    )
+
     def __init__(self, column_name_or_obj: Union[str, Any]) -> None:
         if isinstance(column_name_or_obj, str):
             column_name_or_obj = column(column_name_or_obj)
 
-        if _get_order_direction(column_name_or_obj) is None:
+        direction = _get_order_direction(column_name_or_obj)
+        if direction is None:
             column_name_or_obj = asc(column_name_or_obj)
+            direction = asc_op
 
         self.column_name_or_obj = column_name_or_obj
 
-        warn_if_column_nullable(self.comparable_value)
+        # The wrapped clause never changes, so everything derived from it is computed once
+        self._direction = direction
+        self._element = _remove_order_direction(column_name_or_obj)
+        self._comparable_value = strip_labels(self._element)
+        self._processor_cache: Dict[Any, Optional[Callable[[Any], Any]]] = {}
 
-        self.full_name = str(self.element)
-        try:
-            table_name, name = self.full_name.split(".", 1)
-        except ValueError:
-            table_name = None
-            name = self.full_name
-
-        self.table_name = table_name
-        self.name = name
+        self.full_name = str(self._element)
+        self.table_name, self.name = _split_full_name(self.full_name)
 
     @property
     def quoted_full_name(self) -> str:
@@ -91,23 +112,20 @@ class OrderByColumnWrapper:
     @property
     def element(self) -> ColumnElement:
         """The ordering column/SQL expression with ordering modifier removed."""
-        return _remove_order_direction(self.column_name_or_obj)
+        return self._element
 
     @property
     def comparable_value(self) -> ClauseElement:
         """The ordering column/SQL expression in a form that is suitable for
         incorporating in a ``ROW(...) > ROW(...)`` comparision; i.e. with ordering
         modifiers and labels removed."""
-        return strip_labels(self.element)
+        return self._comparable_value
 
     @property
     def is_ascending(self) -> bool:
         """Returns ``True`` if this column is ascending, ``False`` if
         descending."""
-        d = _get_order_direction(self.column_name_or_obj)
-        if d is None:
-            raise ValueError  # pragma: no cover
-        return d == asc_op
+        return self._direction == asc_op
 
     @property
     def reversed(self) -> "OrderByColumnWrapper":
@@ -115,7 +133,18 @@ class OrderByColumnWrapper:
         new_uo = _reverse_order_direction(self.column_name_or_obj)
         if new_uo is None:
             raise ValueError  # pragma: no cover
-        return OrderByColumnWrapper(new_uo)
+
+        # Only the direction differs, everything derived from the element is shared
+        wrapper = object.__new__(OrderByColumnWrapper)
+        wrapper.column_name_or_obj = new_uo
+        wrapper.full_name = self.full_name
+        wrapper.table_name = self.table_name
+        wrapper.name = self.name
+        wrapper._direction = desc_op if self._direction is asc_op else asc_op
+        wrapper._element = self._element
+        wrapper._comparable_value = self._comparable_value
+        wrapper._processor_cache = self._processor_cache
+        return wrapper
 
     def pair_for_comparison(self, value: Any, dialect: Any) -> Tuple[Any, Any]:
         """Return a pair of SQL expressions representing comparable values for
@@ -127,33 +156,47 @@ class OrderByColumnWrapper:
         :returns: A pair `(a, b)` such that the comparison `a < b` is the
             condition for the value of this OC being past `value` in the paging
             order."""
-        compval = self.comparable_value
+        compval = self._comparable_value
         # If this OC is a column with a custom type, apply the custom
         # preprocessing to the comparsion value:
         try:
-            value = compval.type.bind_processor(dialect)(value)
-        except (TypeError, AttributeError):
-            pass
+            processor = self._processor_cache[dialect]
+        except KeyError:
+            processor = self._processor_cache[dialect] = self._resolve_bind_processor(dialect)
+        if processor is not None:
+            # Bookmark values come from clients, values the type can't process are
+            # compared as they are
+            try:
+                value = processor(value)
+            except (TypeError, AttributeError):
+                pass
         if self.is_ascending:
             return compval, value
 
         return value, compval
 
+    def _resolve_bind_processor(self, dialect: Any) -> Optional[Callable[[Any], Any]]:
+        # The processor depends only on the column type and the dialect, so it's resolved
+        # once per dialect rather than for every compared value
+        try:
+            return self._comparable_value.type.bind_processor(dialect)
+        except (TypeError, AttributeError):
+            return None
+
     def __str__(self) -> str:
         return str(self.column_name_or_obj)
 
     def __repr__(self) -> str:
-        return "<OrderColumnWrapper: {}>".format(str(self))
+        return f"<OrderColumnWrapper: {self}>"
 
 
 def strip_labels(el: Union[Label, ColumnElement]) -> ClauseElement:
     """Remove labels from a
     :class:`sqlalchemy.sql.expression.ColumnElement`."""
+    # Both label types always wrap an element, and ORM ordering yields annotated
+    # subclasses of them, hence isinstance rather than exact type checks
     while isinstance(el, _LABELLED):
-        try:
-            el = el.element
-        except AttributeError:
-            raise ValueError  # pragma: no cover
+        el = el.element
     return el
 
 
@@ -163,7 +206,7 @@ def _get_order_direction(column_element: Any) -> Optional[Callable[[Any], Any]]:
 
     modifier = getattr(column_element, "modifier", None)
 
-    if modifier in {asc_op, desc_op}:
+    if modifier in _ASC_DESC:
         return modifier
 
     return _get_order_direction(getattr(column_element, "element", None))
@@ -176,23 +219,28 @@ def _reverse_order_direction(column_element: ColumnElement) -> ColumnElement:
 
     :param column_element: a :class:`sqlalchemy.sql.expression.ColumnElement`
     """
-    x = copied = column_element._clone()
+    chain = []
+    x = column_element
     for _ in range(_WRAPPING_DEPTH):
+        chain.append(x)
         mod = getattr(x, "modifier", None)
-        if mod in (asc_op, desc_op):
-            if mod == asc_op:
-                x.modifier = desc_op
-            else:
-                x.modifier = asc_op
-            return copied
-        else:
-            if not hasattr(x, "element"):
-                return copied
-            # Since we're going to change something inside x.element, we
-            # need to clone another level deeper.
-            x._copy_internals()
-            x = x.element
-    raise Exception(_WRAPPING_OVERFLOW)  # pragma: no cover
+        if mod in _ASC_DESC:
+            break
+        if not hasattr(x, "element"):
+            return column_element._clone()
+        x = x.element
+    else:
+        raise Exception(_WRAPPING_OVERFLOW)  # pragma: no cover
+
+    # Only the modifier-bearing element and its ancestors are cloned,
+    # everything below it is shared with the original expression.
+    reversed_element = x._clone()
+    reversed_element.modifier = desc_op if mod == asc_op else asc_op
+
+    result = reversed_element
+    for index in range(len(chain) - 2, -1, -1):
+        result = _clone_with_element(chain[index], chain[index + 1], result)
+    return result
 
 
 def _remove_order_direction(column_element: ColumnElement) -> ColumnElement:
@@ -203,9 +251,11 @@ def _remove_order_direction(column_element: ColumnElement) -> ColumnElement:
 
     :param column_element: a :class:`sqlalchemy.sql.expression.ColumnElement`
     """
-    x = copied = column_element._clone()
-    parent = None
-    for _ in range(_WRAPPING_DEPTH):
+    chain = []
+    last_modifier_index = None
+    x = column_element
+    for index in range(_WRAPPING_DEPTH):
+        chain.append(x)
         mod = getattr(x, "modifier", None)
         if mod in _UNSUPPORTED_ORDER_MODIFIERS:
             warn(
@@ -216,23 +266,35 @@ def _remove_order_direction(column_element: ColumnElement) -> ColumnElement:
                 "information."
             )
         if mod in _ORDER_MODIFIERS:
-            x._copy_internals()
-            if parent is None:
-                # The modifier was at the top level; so just take the child.
-                copied = x = x.element
-            else:
-                # Remove this link from the wrapping element chain and return
-                # the top-level expression.
-                parent.element = x = x.element
-        else:
-            if not hasattr(x, "element"):
-                return copied
-            parent = x
-            # Since we might change something inside x.element, we
-            # need to clone another level deeper.
-            x._copy_internals()
-            x = x.element
-    raise Exception(_WRAPPING_OVERFLOW)  # pragma: no cover
+            last_modifier_index = index
+        if not hasattr(x, "element"):
+            break
+        x = x.element
+    else:
+        raise Exception(_WRAPPING_OVERFLOW)  # pragma: no cover
+
+    if last_modifier_index is None:
+        return column_element._clone()
+
+    # The part of the chain below the last modifier is shared with the original
+    # expression; modifiers above it are dropped and the rest of the ancestors cloned.
+    result = chain[last_modifier_index + 1]
+    for index in range(last_modifier_index - 1, -1, -1):
+        element = chain[index]
+        if getattr(element, "modifier", None) in _ORDER_MODIFIERS:
+            continue
+        result = _clone_with_element(element, chain[index + 1], result)
+    return result
+
+
+def _clone_with_element(parent: ClauseElement, child: ClauseElement, new_child: ClauseElement) -> ClauseElement:
+    """Return a shallow clone of `parent` where its wrapped `child` is replaced with `new_child`."""
+    cloned = parent._clone()
+    cloned._copy_internals(clone=lambda element, **kw: new_child if element is child else element)
+    if cloned.element is not new_child:
+        # `element` isn't the wrapped element itself (e.g. a grouping built on access)
+        cloned.element = new_child
+    return cloned
 
 
 class MappedOrderColumn(abc.ABC):
@@ -243,6 +305,8 @@ class MappedOrderColumn(abc.ABC):
     this requires adding extra entities to the query; in this case,
     ``extra_column`` will be set."""
 
+    __slots__ = ("order_by_wrapper", "extra_column")
+
     def __init__(self, order_by_column_wrapper: OrderByColumnWrapper):
         self.order_by_wrapper = order_by_column_wrapper
         self.extra_column = None
@@ -263,8 +327,11 @@ class MappedOrderColumn(abc.ABC):
     def reversed(self) -> "MappedOrderColumn":
         """A :class:`MappedOrderColumn` representing the same column in the
         reversed order."""
-        column = copy(self)
-        column.order_by_wrapper = column.order_by_wrapper.reversed
+        column = object.__new__(type(self))
+        for cls in type(self).__mro__:
+            for slot in cls.__dict__.get("__slots__", ()):
+                setattr(column, slot, getattr(self, slot))
+        column.order_by_wrapper = self.order_by_wrapper.reversed
         return column
 
     def __str__(self) -> str:
@@ -275,21 +342,26 @@ class DirectColumn(MappedOrderColumn):
     """An ordering key that was directly included as a column in the original
     query."""
 
+    __slots__ = ("index", "_get")
+
     def __init__(self, order_by_column_wrapper: OrderByColumnWrapper, index: int):
         super().__init__(order_by_column_wrapper)
         self.index = index
+        self._get = itemgetter(index)
 
     def get_from_row(self, row):
-        return row[self.index]
+        return self._get(row)
 
     def __repr__(self) -> str:
-        return "Direct({}, {!r})".format(self.index, self.order_by_wrapper)
+        return f"Direct({self.index}, {self.order_by_wrapper!r})"
 
 
 class AttributeColumn(MappedOrderColumn):
     """An ordering key that was included as a column attribute in the original
     query."""
 
+    __slots__ = ("index", "attr", "_get", "_attrget")
+
     def __init__(
             self,
             order_by_column_wrapper: OrderByColumnWrapper,
@@ -299,33 +371,37 @@ class AttributeColumn(MappedOrderColumn):
         super().__init__(order_by_column_wrapper)
         self.index = index
         self.attr = attr
+        self._get = itemgetter(index)
+        self._attrget = attrgetter(attr)
 
     def get_from_row(self, row: Any) -> Any:
         if isinstance(row, Row):
-            return getattr(row[self.index], self.attr)
+            return self._attrget(self._get(row))
 
-        return getattr(row, self.attr)
+        return self._attrget(row)
 
     def __repr__(self) -> str:
-        return "Attribute({}.{}, {!r})".format(self.index, self.attr, self.order_by_wrapper)
+        return f"Attribute({self.index}.{self.attr}, {self.order_by_wrapper!r})"
 
 
 class AppendedColumn(MappedOrderColumn):
     """An ordering key that requires an additional column to be added to the
     original query."""
 
-    _counter = 0
+    __slots__ = ("name", "_attrget")
+
+    _counter = itertools.count(1)
 
     def __init__(self, order_by_column_wrapper, name=None):
         super().__init__(order_by_column_wrapper)
         if not name:
-            AppendedColumn._counter += 1
-            name = "{}{}".format(ORDER_COL_PREFIX, AppendedColumn._counter)
+            name = f"{ORDER_COL_PREFIX}{next(AppendedColumn._counter)}"
         self.name = name
+        self._attrget = attrgetter(name)
         self.extra_column = self.order_by_wrapper.comparable_value.label(self.name)
 
     def get_from_row(self, row: Any) -> Any:
-        return getattr(row, self.name)
+        return self._attrget(row)
 
     @property
     def order_by_clause(self):
@@ -333,12 +409,12 @@ class AppendedColumn(MappedOrderColumn):
         return col if self.order_by_wrapper.is_ascending else col.desc()
 
     def __repr__(self) -> str:
-        return "Appended({!r})".format(self.order_by_wrapper)
+        return f"Appended({self.order_by_wrapper!r})"
 
 
 def find_order_key(
         order_column_wrapper: OrderByColumnWrapper,
-        column_descriptions: List[Column]
+        column_descriptions: Sequence[Column]
 ) -> MappedOrderColumn:
     """Return a :class:`MappedOrderColumn` describing how to populate the
     ordering column `order_column_wrapper` from a query returning columns described by
@@ -348,6 +424,10 @@ def find_order_key(
     :param column_descriptions: The list of columns from which to attempt to
         derive the value of `order_column_wrapper`.
     :returns: A :class:`MappedOrderColumn`."""
+    order_key = _find_indexed_order_key(order_column_wrapper, column_descriptions)
+    if order_key is not None:
+        return order_key
+
     for index, desc in enumerate(column_descriptions):
         order_key = derive_order_key(order_column_wrapper, desc, index)
         if order_key is not None:
@@ -358,6 +438,120 @@ def find_order_key(
     return AppendedColumn(order_column_wrapper)
 
 
+def _find_indexed_order_key(
+        order_column_wrapper: OrderByColumnWrapper,
+        column_descriptions: Sequence[Any]
+) -> Optional[MappedOrderColumn]:
+    """Look `order_column_wrapper` up by table and column name among entity and attribute
+    descriptions, and by cache key among plain column elements, instead of comparing it
+    with every description in turn. Returns ``None`` when the lookup can't tell, so the
+    caller falls back to :func:`derive_order_key`."""
+    by_name, by_cache_key, column_element_indexes = _index_column_descriptions(column_descriptions)
+
+    found = by_name.get((order_column_wrapper.table_name, order_column_wrapper.name))
+    cache_key = _get_cache_key(order_column_wrapper.comparable_value)
+    found_by_cache_key = by_cache_key.get(cache_key) if cache_key is not None else None
+    if found_by_cache_key is not None and (found is None or found_by_cache_key < found[0]):
+        found = found_by_cache_key, None
+
+    if found is None:
+        return None
+
+    column_index, attr = found
+    # Cache keys of equal columns can still differ (e.g. by annotations), so column
+    # elements preceding the found description are compared directly
+    for index in column_element_indexes:
+        if index >= column_index:
+            break
+        if column_descriptions[index].compare(order_column_wrapper.comparable_value):
+            return DirectColumn(order_column_wrapper, index)
+
+    if attr is None:
+        return DirectColumn(order_column_wrapper, column_index)
+
+    return AttributeColumn(order_column_wrapper, column_index, attr)
+
+
+def _index_column_descriptions(
+        column_descriptions: Sequence[Any]
+) -> Tuple[Dict[Tuple[Optional[str], str], Tuple[int, Optional[str]]], Dict[Any, int], List[int]]:
+    by_name: Dict[Tuple[Optional[str], str], Tuple[int, Optional[str]]] = {}
+    by_cache_key: Dict[Any, int] = {}
+    column_element_indexes: List[int] = []
+
+    for index, desc in enumerate(column_descriptions):
+        if isinstance(desc, ColumnElement):
+            column_element_indexes.append(index)
+            cache_key = _get_cache_key(desc)
+            if cache_key is not None:
+                by_cache_key.setdefault(cache_key, index)
+            continue
+
+        # Descriptions that can't be indexed (bundles, core columns, ...) might match
+        # before anything indexed after them, so indexing stops at the first one
+        try:
+            expr = desc["expr"]
+            is_entity = not isinstance(expr, Bundle) and _is_entity_description(desc)
+        except (KeyError, TypeError):
+            break
+
+        if is_entity:
+            try:
+                mapper = class_mapper(desc["type"])
+            except sqlalchemy.orm.exc.UnmappedClassError:
+                break
+            for prop in mapper.column_attrs:
+                for prop_column in prop.columns:
+                    table = getattr(prop_column, "table", None)
+                    if table is not None:
+                        by_name.setdefault((table.description, prop_column.name), (index, prop.key))
+        elif isinstance(expr, QueryableAttribute):
+            try:
+                by_name.setdefault((expr.parent.local_table.description, expr.name), (index, None))
+                by_name.setdefault(_split_full_name(str(expr.__clause_element__())), (index, None))
+            except AttributeError:
+                break
+        else:
+            break
+
+    return by_name, by_cache_key, column_element_indexes
+
+
+def _get_cache_key(element: Any) -> Optional[Tuple[Any, ...]]:
+    try:
+        cache_key = element._generate_cache_key()
+    except AttributeError:
+        return None
+
+    if cache_key is None or cache_key.bindparams:
+        return None
+
+    return cache_key.key
+
+
+def _split_full_name(full_name: str) -> Tuple[Optional[str], str]:
+    table_name, separator, name = full_name.partition(".")
+    if not separator:
+        return None, full_name
+
+    return table_name, name
+
+
+def _is_entity_description(desc: Dict[str, Any]) -> bool:
+    entity = desc["entity"]
+    expr = desc["expr"]
+
+    try:
+        is_a_table = bool(entity == expr)
+    except (sqlalchemy.exc.ArgumentError, TypeError):
+        is_a_table = False
+
+    if isinstance(expr, Mapper) and expr.class_ == entity:
+        is_a_table = True
+
+    return is_a_table
+
+
 def derive_order_key(order_column_wrapper: OrderByColumnWrapper, desc: Any, column_index: int):
     """Attempt to derive the value of `order_column_wrapper` from a query column.
 
@@ -373,7 +567,6 @@ def derive_order_key(order_column_wrapper: OrderByColumnWrapper, desc: Any, colu
         else:
             return None
 
-    entity = desc["entity"]
     expr = desc["expr"]
 
     if isinstance(expr, Bundle):
@@ -381,15 +574,7 @@ def derive_order_key(order_column_wrapper: OrderByColumnWrapper, desc: Any, colu
             if strip_labels(col).compare(order_column_wrapper.comparable_value):
                 return AttributeColumn(order_column_wrapper, column_index, key)
 
-    try:
-        is_a_table = bool(entity == expr)
-    except (sqlalchemy.exc.ArgumentError, TypeError):
-        is_a_table = False
-
-    if isinstance(expr, Mapper) and expr.class_ == entity:
-        is_a_table = True
-
-    if is_a_table:
+    if _is_entity_description(desc):
         mapper = class_mapper(desc["type"])
         try:
             prop = mapper.get_property_by_column(order_column_wrapper.element)
@@ -1,22 +1,25 @@
-from typing import List, Any, Dict
+from typing import List, Any, Dict, Optional
 
 from sqlapagination.constants import DEFAULT_PAGE_SIZE
 from sqlapagination.page import AbstractPage, T
 
 
 class LimitOffsetPage(AbstractPage):
+    __slots__ = ('_page_size', '_rows_count', '_current_offset', '_last_seen_pk')
 
     def __init__(
             self,
             rows: List[T],
             page_size: int = DEFAULT_PAGE_SIZE,
             offset: int = 0,
-            rows_count: int = 0
+            rows_count: int = 0,
+            last_seen_pk: Optional[Any] = None
     ) -> None:
         super().__init__(rows)
         self._page_size = page_size
         self._rows_count = rows_count
         self._current_offset = offset
+        self._last_seen_pk = last_seen_pk
 
     @property
     def total_pages_count(self) -> int:
@@ -46,9 +49,13 @@ class LimitOffsetPage(AbstractPage):
         if not self.has_next:
             return {}
 
-        return {
+        next_bookmark = {
             "offset": self._current_offset + self._page_size
         }
+        if self._last_seen_pk is not None:
+            next_bookmark["last_seen_pk"] = self._last_seen_pk
+
+        return next_bookmark
 
     @property
     def has_next(self) -> bool:
@@ -65,7 +72,4 @@ class LimitOffsetPage(AbstractPage):
 
     @property
     def has_previous(self) -> bool:
-        if self._current_offset == 0 or self._current_offset < self._page_size:
-            return False
-
-        return self._current_offset < self._page_size
+        return self._current_offset >= self._page_size
@@ -1,16 +1,28 @@
 import contextlib
-from typing import Sequence, Optional, Dict, Any
+from typing import Sequence, Optional, Dict, Any, Tuple
 
-from sqlalchemy import func, select
+from sqlalchemy import func, tuple_, Column
 from sqlalchemy.engine import Row
+from sqlalchemy.sql.expression import FromClause, Label, UnaryExpression, ColumnElement
+from sqlalchemy.sql.operators import asc_op
 
 from sqlapagination.constants import DEFAULT_PAGE_SIZE
 from sqlapagination.page import AbstractPage
 from sqlapagination.paginators.base import Paginator, R, SelectOrQuery, P
 from sqlapagination.paginators.limit_offset.page import LimitOffsetPage
+from sqlapagination.utils import get_primary_key_value, get_order_by_clauses, _first_item
 
 
 class LimitOffsetPaginator(Paginator):
+    __slots__ = (
+        '_offset',
+        '_last_seen_pk',
+        '_total_count_key',
+        '_first_from',
+        '_primary_keys',
+        '_seek_keys',
+        '_total_count_column'
+    )
 
     def __init__(
             self,
@@ -21,41 +33,144 @@ class LimitOffsetPaginator(Paginator):
     ):
         super().__init__(query_or_select, page_size, bookmark)
         self._offset = self._bookmark.get("offset", 0)
+        self._last_seen_pk = self._bookmark.get("last_seen_pk")
         self._total_count_key = total_count_key
+        # Statements are immutable, so everything derived from the original one is
+        # built once, on first use, and reused for every page
+        self._first_from: Optional[FromClause] = None
+        self._primary_keys: Optional[Tuple[Column, ...]] = None
+        self._seek_keys: Optional[Tuple[Column, ...]] = None
+        self._total_count_column: Optional[Label] = None
+
+    def _get_first_from(self) -> Optional[FromClause]:
+        """The first FROM of the statement, or ``None`` for statements without one
+        (or queries not exposing their FROMs)."""
+        if self._first_from is None:
+            get_final_froms = getattr(self._select_or_query, "get_final_froms", None)
+            final_froms = get_final_froms() if get_final_froms is not None else ()
+            if final_froms:
+                self._first_from = final_froms[0]
+        return self._first_from
+
+    def _get_primary_keys(self) -> Tuple[Column, ...]:
+        if self._primary_keys is None:
+            first_from = self._get_first_from()
+            if first_from is None:
+                return ()
+            primary_key = first_from.primary_key
+            # Tables have a PrimaryKeyConstraint, joins and subqueries a plain ColumnSet
+            self._primary_keys = tuple(getattr(primary_key, "columns", primary_key))
+        return self._primary_keys
+
+    def _get_seek_keys(self) -> Tuple[Column, ...]:
+        """Primary key columns the `last_seen_pk` bookmark seeks by, or an empty tuple if
+        the statement can't be paged that way."""
+        if self._seek_keys is None:
+            self._seek_keys = self._resolve_seek_keys()
+        return self._seek_keys
+
+    def _resolve_seek_keys(self) -> Tuple[Column, ...]:
+        # Seeking past the last seen row only yields the next page if the rows are
+        # ordered by the primary key itself
+        if not get_order_by_clauses(self._select_or_query):
+            return ()
+        primary_keys = self._get_primary_keys()
+        if not _is_ordered_by_columns_ascending(self._select_or_query, primary_keys):
+            return ()
+        return primary_keys
+
+    def _is_seeking(self) -> bool:
+        if self._last_seen_pk is None:
+            return False
+
+        seek_keys = self._get_seek_keys()
+        if not seek_keys:
+            return False
+
+        # The bookmark comes from clients, a value not shaped like the primary key falls
+        # back to paging by offset
+        is_composite_value = isinstance(self._last_seen_pk, (list, tuple))
+        if len(seek_keys) == 1:
+            return not is_composite_value
+
+        return is_composite_value and len(self._last_seen_pk) == len(seek_keys)
 
     def get_modified_sql_statement(self) -> SelectOrQuery:
-        return self._with_total_count_subquery(
+        # Sequential page requests carry the primary key of the last seen row, so the
+        # database can seek straight to the next page instead of scanning `offset` rows.
+        if self._is_seeking():
+            return self._with_total_count(self._seek_after_last_seen_pk())
+
+        return self._with_total_count(
             self._select_or_query.limit(self._page_size).offset(self._offset)
         )
 
+    def _seek_after_last_seen_pk(self) -> SelectOrQuery:
+        seek_keys = self._get_seek_keys()
+        if len(seek_keys) == 1:
+            filter_condition = seek_keys[0] > self._last_seen_pk
+        else:
+            filter_condition = tuple_(*seek_keys) > tuple_(*self._last_seen_pk)
+
+        return self._select_or_query.where(filter_condition).limit(self._page_size)
+
     @contextlib.contextmanager
     def bookmarked(self: P, bookmark: Dict[str, Any]) -> P:
         self._bookmark = bookmark
+        self._is_backward = bookmark.get("direction") == "backward"
         try:
             self._offset = bookmark.get("offset", 0)
+            self._last_seen_pk = bookmark.get("last_seen_pk")
             yield self
         finally:
             self._offset = 0
+            self._last_seen_pk = None
             self._bookmark = {}
+            self._is_backward = False
 
-    def _with_total_count_subquery(self, stmt: SelectOrQuery) -> SelectOrQuery:
-        return stmt.add_columns(
-            select(
-                func.count("*")
-            ).select_from(self._select_or_query.get_final_froms()[0]).scalar_subquery().label(
-                self._total_count_key
-            )
-        )
+    def _build_total_count_column(self) -> Label:
+        # The window is evaluated before LIMIT/OFFSET, so every row carries the count
+        # of all the rows matched by the statement, computed by the database only once
+        return func.count().over().label(self._total_count_key)
+
+    def _with_total_count(self, stmt: SelectOrQuery) -> SelectOrQuery:
+        if self._total_count_column is None:
+            self._total_count_column = self._build_total_count_column()
+        return stmt.add_columns(self._total_count_column)
 
     def parse_result(self, resulted_rows: Sequence[Row]) -> AbstractPage[R]:
         if not resulted_rows:
             return LimitOffsetPage([], self._page_size, self._offset)
 
-        total_rows_count: int = resulted_rows[0][self._total_count_key]
-
         return LimitOffsetPage(
-            [r[0] for r in resulted_rows],
+            list(map(_first_item, resulted_rows)),
             self._page_size,
             self._offset,
-            total_rows_count
+            self._get_total_rows_count(resulted_rows[0]),
+            last_seen_pk=get_primary_key_value(resulted_rows[-1], self._get_seek_keys())
         )
+
+    def _get_total_rows_count(self, row: Row) -> int:
+        total_rows_count: int = row._mapping[self._total_count_key]
+        # Seeking after the last seen primary key leaves the previous pages out of the
+        # window, so they have to be added back
+        if self._is_seeking():
+            return self._offset + total_rows_count
+
+        return total_rows_count
+
+
+def _is_ordered_by_columns_ascending(stmt: SelectOrQuery, columns: Sequence[Column]) -> bool:
+    order_by_clauses = get_order_by_clauses(stmt)
+    if not columns or len(order_by_clauses) != len(columns):
+        return False
+
+    for clause, column in zip(order_by_clauses, columns):
+        if isinstance(clause, UnaryExpression):
+            if clause.modifier is not asc_op:
+                return False
+            clause = clause.element
+        if not isinstance(clause, ColumnElement) or not clause.compare(column):
+            return False
+
+    return True
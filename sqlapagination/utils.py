@@ -1,32 +1,58 @@
-from typing import List, Any, Sequence, Union, TypeVar
+from operator import itemgetter
+from typing import List, Any, Sequence, Union, TypeVar, Optional, Dict
 
+from sqlalchemy import inspect, Column
 from sqlalchemy.engine import Connection, Row, Dialect
+from sqlalchemy.exc import NoInspectionAvailable
 from sqlalchemy.ext.asyncio import AsyncSession, AsyncConnection
 from sqlalchemy.orm import Query, ColumnProperty, Session
 from sqlalchemy.sql import Select
 
 T = TypeVar('T')
 
+_first_item = itemgetter(0)
 
-def get_value_from_row_by_column_name(row: Any, column_name: str) -> Any:
+
+def get_values_from_row_by_column_names(row: Any, column_names: Sequence[str]) -> Dict[str, Any]:
     if isinstance(row, Row):
-        row = row._mapping()
-        return row[column_name]
+        mapping = row._mapping
+        return {column_name: mapping[column_name] for column_name in column_names}
 
-    return getattr(row, column_name)
+    return {column_name: getattr(row, column_name) for column_name in column_names}
 
 
 def unpack_rows_if_row_contains_only_orm_model(rows: Sequence[T]) -> List[T]:
-    unpacked = []
+    if not rows:
+        return []
+
+    # All rows of a single result share the same shape, so the first one is enough to decide
+    if len(rows[0]) != 1:
+        return list(rows)
+
+    return list(map(_first_item, rows))
+
+
+def get_primary_key_value(row: Row, primary_keys: Sequence[Column]) -> Optional[Any]:
+    if not primary_keys:
+        return None
+
+    mapping = row._mapping
+    if all(column in mapping for column in primary_keys):
+        identity = [mapping[column] for column in primary_keys]
+    else:
+        try:
+            identity = inspect(row[0]).identity
+        except NoInspectionAvailable:
+            return None
 
-    for row in rows:
-        if len(row.keys()) != 1:
-            unpacked.append(row)
-            continue
+    # The identity of the first entity doesn't cover keys spanning several entities
+    if identity is None or len(identity) != len(primary_keys):
+        return None
 
-        unpacked.append(row[0])
+    if len(identity) == 1:
+        return identity[0]
 
-    return unpacked
+    return list(identity)
 
 
 def get_column_descriptors(selectable_or_query: Union[Query, Select]) -> List[ColumnProperty]:
@@ -2,9 +2,10 @@ import enum
 from datetime import timedelta
 from random import randrange
 
-from sqlalchemy import String, Column, Integer, func, ForeignKey, select, Enum
+import pytest
+from sqlalchemy import String, Column, Integer, func, ForeignKey, select, Enum, create_engine
 from sqlalchemy.ext.hybrid import hybrid_property
-from sqlalchemy.orm import declarative_base, column_property, relationship
+from sqlalchemy.orm import declarative_base, column_property, relationship, Session
 from sqlalchemy_utils import ArrowType
 from sqlalchemy_utils.types.arrow import arrow
 
@@ -71,3 +72,25 @@ class Author(Base):
                 .where(Book.author_id == cls.id)
                 .label("book_count")
         )
+
+
+@pytest.fixture()
+def authors_session():
+    """Factory of sessions over an in-memory SQLite database holding authors with ids
+    from 1 to the given count."""
+    engine = create_engine("sqlite://")
+    Base.metadata.create_all(engine)
+    sessions = []
+
+    def make_session(authors_count):
+        session = Session(engine)
+        sessions.append(session)
+        session.add_all([Author(id=i, name=f"author {i}", info="") for i in range(1, authors_count + 1)])
+        session.flush()
+        return session
+
+    yield make_session
+
+    for session in sessions:
+        session.close()
+    engine.dispose()
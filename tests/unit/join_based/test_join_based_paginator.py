@@ -0,0 +1,15 @@
+from sqlalchemy import select
+
+from sqlapagination import JoinBasedPaginator
+from tests.conftest import Author
+
+
+def test_pages_are_bookmarked_by_offset_only(authors_session):
+    session = authors_session(5)
+    paginator = JoinBasedPaginator(select(Author).order_by(Author.id), page_size=2)
+
+    page = paginator.parse_result(session.execute(paginator.get_modified_sql_statement()).all())
+
+    assert [author.id for author in page] == [1, 2]
+    assert page.next == {"offset": 2}
+    assert page.last_page == {"offset": 3}
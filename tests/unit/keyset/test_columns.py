@@ -0,0 +1,31 @@
+import gc
+
+from sqlalchemy import Column, Integer, MetaData, Table
+from sqlalchemy.sql.elements import ColumnElement
+
+from sqlapagination.paginators.keyset.inspection import columns
+from sqlapagination.paginators.keyset.inspection.columns import warn_if_column_nullable
+from tests.conftest import Book
+
+
+def test_inspected_column_is_not_compared_with_eq(monkeypatch):
+    column = Book.__table__.c.b
+    warn_if_column_nullable(column)
+
+    def fail_on_eq(self, other):
+        raise AssertionError("column compared with ==")
+
+    monkeypatch.setattr(ColumnElement, "__eq__", fail_on_eq)
+    warn_if_column_nullable(column)
+
+
+def test_inspected_column_is_forgotten_once_collected():
+    table = Table("events", MetaData(), Column("id", Integer, nullable=False))
+    column_id = id(table.c.id)
+    warn_if_column_nullable(table.c.id)
+    assert column_id in columns._NOT_NULLABLE_COLUMN_IDS
+
+    del table
+    gc.collect()
+
+    assert column_id not in columns._NOT_NULLABLE_COLUMN_IDS
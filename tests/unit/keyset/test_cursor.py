@@ -0,0 +1,34 @@
+import pytest
+from sqlalchemy import select
+
+from sqlapagination import KeySetPaginator, encode_cursor, decode_cursor
+from sqlapagination.exceptions import InvalidCursorError
+from tests.conftest import Author
+
+
+def test_cursor_round_trip():
+    bookmark = {"keyset_pairs": {"id": 10}, "direction": "backward"}
+
+    cursor = encode_cursor(bookmark)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == bookmark
+
+
+def test_decode_malformed_cursor():
+    with pytest.raises(InvalidCursorError):
+        decode_cursor("not a cursor")
+
+
+def test_paginator_accepts_cursor_bookmark():
+    bookmark = {"keyset_pairs": {"id": 10}, "direction": "forward"}
+    paginator_with_cursor = KeySetPaginator(
+        select(Author).order_by(Author.id),
+        bookmark={"cursor": encode_cursor(bookmark)}
+    )
+    paginator = KeySetPaginator(select(Author).order_by(Author.id), bookmark=bookmark)
+
+    assert (
+            paginator_with_cursor.get_modified_sql_statement().compile().string
+            == paginator.get_modified_sql_statement().compile().string
+    )
@@ -1,6 +1,10 @@
-from sqlalchemy import select, asc, desc
+import warnings
 
-from sqlapagination import KeySetPaginator, DEFAULT_PAGE_SIZE
+from sqlalchemy import select, asc, desc, create_engine, text, tuple_, or_, and_
+from sqlalchemy.dialects import mssql
+
+from sqlapagination import KeySetPaginator, KeySetPage, DEFAULT_PAGE_SIZE, decode_cursor
+from sqlapagination.paginators.keyset.paginator import ParsingMetadata
 from tests.conftest import Author, Book
 
 
@@ -79,3 +83,169 @@ class TestGetModifiedSqlStatement:
         ).order_by(Book.popularity.element).limit(DEFAULT_PAGE_SIZE).compile().string
 
         assert compiled_pagination_query == compiled_expected_query
+
+    def test_get_modified_sql_statement_with_multi_column_bookmark(self):
+        paginator = KeySetPaginator(
+            select(Book).order_by(Book.b, Book.id),
+            bookmark={
+                "keyset_pairs": {
+                    "b": 1,
+                    "book_id": 10,
+                },
+                "direction": "forward",
+            }
+        )
+
+        compiled_paginators_query = paginator.get_modified_sql_statement().compile().string
+        compiled_expected_query = select(Book).where(
+            tuple_(1, 10) < tuple_(Book.b, Book.id)
+        ).order_by(asc(Book.b), asc(Book.id)).limit(DEFAULT_PAGE_SIZE).compile().string
+
+        assert compiled_paginators_query == compiled_expected_query
+
+    def test_get_modified_sql_statement_without_native_row_values(self):
+        paginator = KeySetPaginator(
+            select(Book).order_by(Book.b, Book.id),
+            dialect=mssql.dialect(),
+            bookmark={
+                "keyset_pairs": {
+                    "b": 1,
+                    "book_id": 10,
+                },
+                "direction": "forward",
+            }
+        )
+
+        compiled_paginators_query = paginator.get_modified_sql_statement().compile().string
+        compiled_expected_query = select(Book).where(
+            or_(Book.b > 1, and_(Book.b == 1, Book.id > 10))
+        ).order_by(asc(Book.b), asc(Book.id)).limit(DEFAULT_PAGE_SIZE).compile().string
+
+        assert compiled_paginators_query == compiled_expected_query
+
+    def test_ordering_is_restored_after_backward_bookmark(self):
+        paginator = KeySetPaginator(select(Author).order_by(Author.id))
+        expected_query = paginator.get_modified_sql_statement().compile().string
+
+        with paginator.bookmarked({"keyset_pairs": {"id": 10}, "direction": "backward"}):
+            paginator.get_modified_sql_statement()
+
+        assert paginator.get_modified_sql_statement().compile().string == expected_query
+
+    def test_ordering_analysis_is_shared_by_paginators_over_same_statement(self):
+        statement = select(Author).order_by(Author.id)
+
+        first_paginator = KeySetPaginator(statement)
+        second_paginator = KeySetPaginator(statement)
+
+        assert first_paginator._order_by_clauses is second_paginator._order_by_clauses
+
+    def test_nullable_order_column_warns_for_every_paginator(self):
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            KeySetPaginator(select(Book).order_by(Book.a, Book.id))
+            KeySetPaginator(select(Book).order_by(Book.a, Book.id))
+
+        assert len([w for w in caught if "nullable" in str(w.message)]) == 2
+
+    def test_nullable_order_column_warns_for_every_paginator_over_same_statement(self):
+        statement = select(Book).order_by(Book.a, Book.id)
+
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            KeySetPaginator(statement)
+            KeySetPaginator(statement)
+
+        assert len([w for w in caught if "nullable" in str(w.message)]) == 2
+
+    def test_nullable_order_column_warning_points_to_caller(self):
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            KeySetPaginator(select(Book).order_by(Book.a, Book.id))
+
+        assert [w.filename for w in caught if "nullable" in str(w.message)] == [__file__]
+
+
+class TestKeySetPage:
+
+    def _make_page(self, ids, page_size, bookmark=None):
+        paginator = KeySetPaginator(select(Author).order_by(Author.id), bookmark=bookmark)
+        return KeySetPage(
+            [Author(id=i) for i in ids],
+            ParsingMetadata(
+                page_size=page_size,
+                order_by_columns=paginator._order_by_columns,
+                bookmark=paginator._bookmark,
+                is_backward=paginator._is_backward
+            )
+        )
+
+    def test_forward_page_with_more_entries(self):
+        page = self._make_page([1, 2, 3, 4], page_size=3)
+
+        assert [a.id for a in page] == [1, 2, 3]
+        assert page.next == {"keyset_pairs": {"id": 3}, "direction": "forward"}
+        assert decode_cursor(page.next_cursor) == page.next
+        assert page.previous == {}
+        assert page.previous_cursor is None
+
+    def test_last_forward_page(self):
+        page = self._make_page([1, 2], page_size=3)
+
+        assert [a.id for a in page] == [1, 2]
+        assert page.next == {}
+        assert page.next_cursor is None
+
+    def test_backward_page(self):
+        bookmark = {"keyset_pairs": {"id": 5}, "direction": "backward"}
+        page = self._make_page([4, 3, 2, 1], page_size=3, bookmark=bookmark)
+
+        assert [a.id for a in page] == [2, 3, 4]
+        assert page.next == {"keyset_pairs": {"id": 4}, "direction": "forward"}
+        assert page.previous == {"keyset_pairs": {"id": 2}, "direction": "backward"}
+
+    def test_first_backward_page(self):
+        bookmark = {"keyset_pairs": {"id": 4}, "direction": "backward"}
+        page = self._make_page([3, 2, 1], page_size=3, bookmark=bookmark)
+
+        assert [a.id for a in page] == [1, 2, 3]
+        assert page.next == {"keyset_pairs": {"id": 3}, "direction": "forward"}
+        assert page.previous == {}
+
+    def test_page_of_core_rows(self):
+        with create_engine("sqlite://").connect() as connection:
+            rows = connection.execute(
+                text("SELECT 1 AS id, 'a' AS name UNION ALL SELECT 2, 'b'")
+            ).all()
+
+        paginator = KeySetPaginator(select(Author).order_by(Author.id))
+        page = KeySetPage(
+            rows,
+            ParsingMetadata(
+                page_size=1,
+                order_by_columns=paginator._order_by_columns,
+                bookmark={},
+                is_backward=False
+            )
+        )
+
+        assert page.next == {"keyset_pairs": {"id": 1}, "direction": "forward"}
+
+    def test_navigation_visits_every_row_once(self, authors_session):
+        session = authors_session(10)
+
+        def fetch(bookmark):
+            paginator = KeySetPaginator(select(Author).order_by(Author.id), page_size=3, bookmark=bookmark)
+            return paginator.parse_result(session.execute(paginator.get_modified_sql_statement()).all())
+
+        forward_pages = [fetch({})]
+        while forward_pages[-1].has_next:
+            forward_pages.append(fetch(forward_pages[-1].next))
+
+        backward_pages = [forward_pages[-1]]
+        while backward_pages[-1].has_previous:
+            backward_pages.append(fetch(backward_pages[-1].previous))
+
+        assert [[a.id for a in page] for page in forward_pages] == [[1, 2, 3], [4, 5, 6], [7, 8, 9], [10]]
+        assert [[a.id for a in page] for page in backward_pages] == [[10], [7, 8, 9], [4, 5, 6], [1, 2, 3]]
+
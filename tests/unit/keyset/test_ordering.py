@@ -0,0 +1,78 @@
+from datetime import datetime
+
+import arrow
+from sqlalchemy import select, inspect
+from sqlalchemy.dialects import sqlite
+from sqlalchemy.orm import aliased
+from sqlalchemy.sql.expression import ClauseList
+
+from sqlapagination.paginators.keyset.utils.ordering import (
+    parse_order_by_clause,
+    find_order_key,
+    _parse_order_by_clauses,
+    AttributeColumn,
+    DirectColumn
+)
+from tests.conftest import Author, Book
+
+
+def test_equal_statements_over_different_aliases_keep_their_own_alias():
+    first_alias, second_alias = aliased(Author), aliased(Author)
+    first = parse_order_by_clause(select(first_alias).order_by(first_alias.id))
+    second = parse_order_by_clause(select(second_alias).order_by(second_alias.id))
+
+    assert first[0].comparable_value.table is inspect(first_alias).selectable
+    assert second[0].comparable_value.table is inspect(second_alias).selectable
+
+
+def test_nested_order_by_clauses_are_flattened():
+    parsed = _parse_order_by_clauses([ClauseList(Book.b, Book.c), (Book.d, Book.id)])
+
+    assert [wrapper.name for wrapper in parsed] == ["b", "c", "d", "book_id"]
+
+
+def test_reversed_mapped_order_column():
+    statement = select(Author).order_by(Author.id)
+    mapped_column = find_order_key(parse_order_by_clause(statement)[0], statement.column_descriptions)
+
+    reversed_column = mapped_column.reversed
+
+    assert type(reversed_column) is type(mapped_column)
+    assert reversed_column.attr == mapped_column.attr
+    assert not reversed_column.order_by_wrapper.is_ascending
+    assert mapped_column.order_by_wrapper.is_ascending
+
+
+def test_order_key_is_found_in_a_later_entity():
+    statement = select(Author, Book).join(Book, Book.author_id == Author.id).order_by(Book.id)
+    mapped_column = find_order_key(parse_order_by_clause(statement)[0], statement.column_descriptions)
+
+    assert isinstance(mapped_column, AttributeColumn)
+    assert (mapped_column.index, mapped_column.attr) == (1, "id")
+
+
+def test_order_key_is_found_in_a_selected_attribute():
+    statement = select(Author.id, Book.id).order_by(Book.id)
+    mapped_column = find_order_key(parse_order_by_clause(statement)[0], statement.column_descriptions)
+
+    assert isinstance(mapped_column, DirectColumn)
+    assert mapped_column.index == 1
+
+
+def test_bind_processor_is_resolved_once_per_dialect():
+    wrapper = parse_order_by_clause(select(Book).order_by(Book.published_at))[0]
+    dialect = sqlite.dialect()
+
+    first = wrapper.pair_for_comparison(arrow.get("2020-01-01"), dialect)
+    second = wrapper.pair_for_comparison(arrow.get("2020-01-01"), dialect)
+
+    assert first[1] == second[1] == datetime(2020, 1, 1)
+    assert wrapper._processor_cache[dialect] is not None
+
+
+def test_value_the_bind_processor_cannot_handle_is_compared_as_is():
+    wrapper = parse_order_by_clause(select(Book).order_by(Book.published_at))[0]
+
+    for dialect in (None, sqlite.dialect()):
+        assert wrapper.pair_for_comparison(12345, dialect)[1] == 12345
+
@@ -0,0 +1,204 @@
+from sqlalchemy import select, func, create_engine, tuple_, literal, Table, Column, Integer, MetaData
+from sqlalchemy.orm import Query
+
+from sqlapagination import LimitOffsetPaginator, LimitOffsetPage, DEFAULT_PAGE_SIZE
+from tests.conftest import Author, Book
+
+TOTAL_COUNT_KEY = "sqlalchemy_pagination_total_count"
+
+
+def _total_count_column():
+    return func.count().over().label(TOTAL_COUNT_KEY)
+
+
+def _fetch_page(session, paginator):
+    return paginator.parse_result(session.execute(paginator.get_modified_sql_statement()).all())
+
+
+def _fetch_all_pages(session, statement, page_size=2):
+    pages = [_fetch_page(session, LimitOffsetPaginator(statement, page_size=page_size))]
+    while pages[-1].has_next:
+        pages.append(_fetch_page(session, LimitOffsetPaginator(statement, page_size, pages[-1].next)))
+    return pages
+
+
+class TestGetModifiedSqlStatement:
+
+    def test_get_modified_sql_statement_with_offset_bookmark(self):
+        paginator = LimitOffsetPaginator(select(Author).order_by(Author.id), bookmark={"offset": 20})
+
+        compiled_paginators_query = paginator.get_modified_sql_statement().compile().string
+        compiled_expected_query = select(Author).order_by(Author.id).limit(DEFAULT_PAGE_SIZE).offset(
+            20
+        ).add_columns(_total_count_column()).compile().string
+
+        assert compiled_paginators_query == compiled_expected_query
+
+    def test_get_modified_sql_statement_with_last_seen_pk_bookmark(self):
+        paginator = LimitOffsetPaginator(
+            select(Author).order_by(Author.id),
+            bookmark={"offset": 20, "last_seen_pk": 20}
+        )
+
+        compiled_paginators_query = paginator.get_modified_sql_statement().compile().string
+        compiled_expected_query = select(Author).where(Author.id > 20).order_by(Author.id).limit(
+            DEFAULT_PAGE_SIZE
+        ).add_columns(_total_count_column()).compile().string
+
+        assert compiled_paginators_query == compiled_expected_query
+
+    def test_last_seen_pk_is_ignored_if_not_ordered_by_primary_key(self):
+        paginator = LimitOffsetPaginator(
+            select(Author).order_by(Author.name),
+            bookmark={"offset": 20, "last_seen_pk": 20}
+        )
+
+        compiled_paginators_query = paginator.get_modified_sql_statement().compile().string
+        compiled_expected_query = select(Author).order_by(Author.name).limit(DEFAULT_PAGE_SIZE).offset(
+            20
+        ).add_columns(_total_count_column()).compile().string
+
+        assert compiled_paginators_query == compiled_expected_query
+
+    def test_get_modified_sql_statement_of_join(self):
+        statement = select(Author, Book).join(Author.books).order_by(Author.id, Book.id)
+        paginator = LimitOffsetPaginator(statement, bookmark={"offset": 20, "last_seen_pk": [1, 2]})
+
+        compiled_paginators_query = paginator.get_modified_sql_statement().compile().string
+        compiled_expected_query = statement.where(
+            tuple_(Author.id, Book.id) > tuple_(1, 2)
+        ).limit(DEFAULT_PAGE_SIZE).add_columns(_total_count_column()).compile().string
+
+        assert compiled_paginators_query == compiled_expected_query
+
+    def test_malformed_composite_last_seen_pk_falls_back_to_offset(self):
+        table = Table(
+            "pairs",
+            MetaData(),
+            Column("a", Integer, primary_key=True),
+            Column("b", Integer, primary_key=True)
+        )
+        statement = select(table).order_by(table.c.a, table.c.b)
+        paginator = LimitOffsetPaginator(statement, bookmark={"offset": 20, "last_seen_pk": 5})
+
+        compiled_paginators_query = paginator.get_modified_sql_statement().compile().string
+        compiled_expected_query = statement.limit(DEFAULT_PAGE_SIZE).offset(
+            20
+        ).add_columns(_total_count_column()).compile().string
+
+        assert compiled_paginators_query == compiled_expected_query
+
+    def test_get_modified_sql_statement_without_from(self):
+        paginator = LimitOffsetPaginator(select(literal(1)), bookmark={"offset": 20, "last_seen_pk": 20})
+
+        compiled_paginators_query = paginator.get_modified_sql_statement().compile().string
+        compiled_expected_query = select(literal(1)).limit(DEFAULT_PAGE_SIZE).offset(
+            20
+        ).add_columns(_total_count_column()).compile().string
+
+        assert compiled_paginators_query == compiled_expected_query
+
+    def test_get_modified_sql_statement_of_query(self):
+        query = Query(Author).order_by(Author.id)
+        paginator = LimitOffsetPaginator(query, bookmark={"offset": 20})
+
+        compiled_paginators_query = str(paginator.get_modified_sql_statement())
+        compiled_expected_query = str(query.limit(DEFAULT_PAGE_SIZE).offset(20).add_columns(_total_count_column()))
+
+        assert compiled_paginators_query == compiled_expected_query
+
+    def test_get_modified_sql_statement_of_subquery(self):
+        subquery = select(Author).subquery()
+        statement = select(subquery).order_by(subquery.c.name)
+        paginator = LimitOffsetPaginator(statement, bookmark={"offset": 20, "last_seen_pk": 20})
+
+        compiled_paginators_query = paginator.get_modified_sql_statement().compile().string
+        compiled_expected_query = statement.limit(DEFAULT_PAGE_SIZE).offset(
+            20
+        ).add_columns(_total_count_column()).compile().string
+
+        assert compiled_paginators_query == compiled_expected_query
+
+
+class TestParseResult:
+
+    def test_parse_result_of_executed_statement(self, authors_session):
+        paginator = LimitOffsetPaginator(select(Author).order_by(Author.id), page_size=2)
+
+        page = _fetch_page(authors_session(5), paginator)
+
+        assert [author.id for author in page] == [1, 2]
+        assert page.last_page == {"offset": 3}
+        assert page.next == {"offset": 2, "last_seen_pk": 2}
+
+    def test_total_count_includes_rows_before_last_seen_pk(self, authors_session):
+        paginator = LimitOffsetPaginator(
+            select(Author).order_by(Author.id),
+            page_size=2,
+            bookmark={"offset": 2, "last_seen_pk": 2}
+        )
+
+        page = _fetch_page(authors_session(5), paginator)
+
+        assert [author.id for author in page] == [3, 4]
+        assert page.last_page == {"offset": 3}
+
+    def test_pages_follow_primary_key_ordering(self, authors_session):
+        pages = _fetch_all_pages(authors_session(6), select(Author).order_by(Author.id))
+
+        assert [[author.id for author in page] for page in pages] == [[1, 2], [3, 4], [5, 6]]
+        assert "last_seen_pk" in pages[0].next
+
+    def test_pages_follow_non_primary_key_ordering(self, authors_session):
+        pages = _fetch_all_pages(authors_session(6), select(Author).order_by(Author.name.desc()))
+
+        assert [[author.id for author in page] for page in pages] == [[6, 5], [4, 3], [2, 1]]
+        assert "last_seen_pk" not in pages[0].next
+
+    def test_pages_follow_descending_primary_key_ordering(self, authors_session):
+        pages = _fetch_all_pages(authors_session(6), select(Author).order_by(Author.id.desc()))
+
+        assert [[author.id for author in page] for page in pages] == [[6, 5], [4, 3], [2, 1]]
+
+    def test_no_last_seen_pk_without_primary_key(self):
+        table = Table("events", MetaData(), Column("value", Integer))
+        engine = create_engine("sqlite://")
+        table.metadata.create_all(engine)
+        paginator = LimitOffsetPaginator(select(table).order_by(table.c.value), page_size=1)
+
+        with engine.connect() as connection:
+            connection.execute(table.insert(), [{"value": 1}, {"value": 2}])
+            page = paginator.parse_result(connection.execute(paginator.get_modified_sql_statement()).all())
+
+        assert page.next == {"offset": 1}
+
+
+class TestLimitOffsetPage:
+
+    def test_next_contains_last_seen_pk(self):
+        page = LimitOffsetPage([], page_size=10, offset=10, rows_count=100, last_seen_pk=20)
+
+        assert page.next == {"offset": 20, "last_seen_pk": 20}
+
+    def test_next_without_last_seen_pk(self):
+        page = LimitOffsetPage([], page_size=10, offset=10, rows_count=100)
+
+        assert page.next == {"offset": 20}
+
+    def test_first_page_has_no_previous(self):
+        page = LimitOffsetPage([], page_size=10, offset=0, rows_count=100)
+
+        assert not page.has_previous
+        assert page.previous == {}
+
+    def test_second_page_has_previous(self):
+        page = LimitOffsetPage([], page_size=10, offset=10, rows_count=100)
+
+        assert page.has_previous
+        assert page.previous == {"offset": 0}
+
+    def test_third_page_has_previous(self):
+        page = LimitOffsetPage([], page_size=10, offset=20, rows_count=100)
+
+        assert page.has_previous
+        assert page.previous == {"offset": 10}